@@ -4,21 +4,53 @@ Burp Suite extension that helps identify unique requests by normalizing paths an
 Provides two modes: Normal Request mode for standard HTTP requests and GraphQL mode for GraphQL operations.
 """
 
-from burp import IBurpExtender, ITab, IMessageEditorController
+from burp import IBurpExtender, ITab, IMessageEditorController, IHttpListener
 from javax.swing import (
     JPanel, JButton, JTable, JScrollPane, JSplitPane,
     JPopupMenu, JMenuItem, JTextField, JLabel, JOptionPane,
-    JCheckBoxMenuItem, JToggleButton, ButtonGroup, Box, Timer
+    JCheckBoxMenuItem, JToggleButton, ButtonGroup, Box, Timer, SwingWorker,
+    SwingUtilities
 )
 from javax.swing.event import ListSelectionListener, DocumentListener
 from javax.swing.table import DefaultTableModel, TableRowSorter
 from javax.swing import RowFilter, SortOrder
 from java.awt import BorderLayout, Dimension, GridLayout
 from java.awt.event import MouseAdapter, ActionListener
-from java.util import Comparator
-import hashlib
+from java.lang import Runnable
+from java.util import Comparator, Vector
+from java.util.concurrent import CancellationException, ExecutionException
 import re
 import json
+from collections import namedtuple
+
+
+# Dynamic path segments collapsed by BurpExtender._normalize_path in a single pass
+_PAT = re.compile(r"(/\d+)|(/[a-f0-9]{32,})|(id=\d+)")
+
+# Static resources dropped by the "No extensions" filter
+_BLOCKED_EXTS = (".js", ".css", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico",
+                 ".woff", ".woff2", ".ttf", ".eot", ".map", ".json")
+
+# Upper bound on memoized raw path -> normalized path entries
+_NORM_CACHE_SIZE = 4096
+
+# GraphQL bodies larger than this are not decoded
+_MAX_GRAPHQL_BODY = 1024 * 1024
+
+# Leading whitespace and first byte of a JSON object, compared against the raw request bytes
+_JSON_WHITESPACE = frozenset(ord(c) for c in " \t\r\n")
+_JSON_OBJECT_START = ord("{")
+
+# Unique rows published to the table per batch while the normal analysis runs
+_NORMAL_PUBLISH_BATCH = 500
+
+# Quiet period after the last keystroke before the search filter is applied
+_SEARCH_DELAY_MS = 200
+
+
+# Per-row metadata kept alongside each unique proxy item
+NormalMeta = namedtuple("NormalMeta", "id method host normalized")
+GraphqlMeta = namedtuple("GraphqlMeta", "id method url operation")
 
 
 class NumericComparator(Comparator):
@@ -46,6 +78,18 @@ class BurpExtender(IBurpExtender, ITab, IMessageEditorController):
         self._current_request = None
         self._current_response = None
         self._current_service = None
+        self._last_selected_item = None
+        self._norm_cache = {}
+        self._analyze_cache = {}
+        self._last_history = None
+        self._normal_worker = None
+        # Dedupe state of the last completed normal scan; None until Start runs
+        self._normal_seen = None
+        self._normal_next_id = 1
+        self._normal_pending = []
+        # (item, (method, host, path)) for Proxy traffic seen since the snapshot
+        self._live_items = []
+        self._live_seen = set()
 
         # Initialize UI components
         self._requestViewer = callbacks.createMessageEditor(self, False)
@@ -53,6 +97,7 @@ class BurpExtender(IBurpExtender, ITab, IMessageEditorController):
 
         self._setup_ui()
         callbacks.addSuiteTab(self)
+        callbacks.registerHttpListener(ProxyFeed(self))
 
     def _setup_ui(self):
         """Set up the main UI components and layout."""
@@ -132,16 +177,16 @@ class BurpExtender(IBurpExtender, ITab, IMessageEditorController):
         self._normal_sorter.setSortKeys([TableRowSorter.SortKey(0, SortOrder.ASCENDING)])
 
         self._normal_table.getSelectionModel().addListSelectionListener(
-            lambda e: self._on_row_select(e, "normal"))
+            ModeSelectionListener(self, "normal"))
 
         # Popup menu
         self._normal_popup_menu = JPopupMenu()
-        self._normal_popup_menu.add(
-            JMenuItem("Send to Repeater", 
-                     actionPerformed=lambda e: self._send_to_repeater(e, "normal")))
-        self._normal_popup_menu.add(
-            JMenuItem("Clear Row", 
-                     actionPerformed=lambda e: self._clear_selected_row(e, "normal")))
+        repeater_item = JMenuItem("Send to Repeater")
+        repeater_item.addActionListener(ModeActionListener(self._send_to_repeater, "normal"))
+        self._normal_popup_menu.add(repeater_item)
+        clear_item = JMenuItem("Clear Row")
+        clear_item.addActionListener(ModeActionListener(self._clear_selected_row, "normal"))
+        self._normal_popup_menu.add(clear_item)
 
         self._normal_table.addMouseListener(TableMouseAdapter(self._normal_table, self._normal_popup_menu))
 
@@ -183,16 +228,16 @@ class BurpExtender(IBurpExtender, ITab, IMessageEditorController):
         self._graphql_sorter.setSortKeys([TableRowSorter.SortKey(0, SortOrder.ASCENDING)])
 
         self._graphql_table.getSelectionModel().addListSelectionListener(
-            lambda e: self._on_row_select(e, "graphql"))
+            ModeSelectionListener(self, "graphql"))
 
         # Popup menu
         self._graphql_popup_menu = JPopupMenu()
-        self._graphql_popup_menu.add(
-            JMenuItem("Send to Repeater", 
-                     actionPerformed=lambda e: self._send_to_repeater(e, "graphql")))
-        self._graphql_popup_menu.add(
-            JMenuItem("Clear Row", 
-                     actionPerformed=lambda e: self._clear_selected_row(e, "graphql")))
+        repeater_item = JMenuItem("Send to Repeater")
+        repeater_item.addActionListener(ModeActionListener(self._send_to_repeater, "graphql"))
+        self._graphql_popup_menu.add(repeater_item)
+        clear_item = JMenuItem("Clear Row")
+        clear_item.addActionListener(ModeActionListener(self._clear_selected_row, "graphql"))
+        self._graphql_popup_menu.add(clear_item)
 
         self._graphql_table.addMouseListener(TableMouseAdapter(self._graphql_table, self._graphql_popup_menu))
 
@@ -238,82 +283,157 @@ class BurpExtender(IBurpExtender, ITab, IMessageEditorController):
         self._central_panel.revalidate()
         self._central_panel.repaint()
 
-        # Additional update after a short delay to ensure proper layout
-        def delayed_update():
-            if mode == "normal":
-                self._normal_split_pane.setDividerLocation(0.4)
-            else:
-                self._graphql_split_pane.setDividerLocation(0.4)
-            self._viewer_split.setDividerLocation(0.4)
-            
-        class DelayedUpdateListener(ActionListener):
-            def actionPerformed(self, event):
-                delayed_update()
-                
-        timer = Timer(100, DelayedUpdateListener())
-        timer.setRepeats(False)
-        timer.start()
+        # Additional update once the pending layout has run
+        SwingUtilities.invokeLater(DividerUpdater(self, mode))
 
     def _run_normal_analysis(self, event):
         """Analyze and display unique normal requests."""
+        if self._normal_worker is not None:
+            self._normal_worker.cancel(True)
         self.normal_requests = []
         self._normal_table_model.setRowCount(0)
-        seen_hashes = set()
-        http_items = self._callbacks.getProxyHistory()
-
-        filter_post = self._normal_filter_post.isSelected()
-        filter_get = self._normal_filter_get.isSelected()
-        filter_no_ext = self._normal_filter_no_ext.isSelected()
-
-        for item in http_items:
-            request_info = self._helpers.analyzeRequest(item)
-            method = request_info.getMethod()
-            url = request_info.getUrl()
-            host = url.getHost()
-            path = url.getPath()
-
-            if "graphql" in path.lower():
-                continue
-
-            if filter_post and not filter_get:
-                if method.upper() != "POST":
-                    continue
-            elif filter_get and not filter_post:
-                if method.upper() != "GET":
-                    continue
-
-            if filter_no_ext:
-                if re.search(r"\.(js|css|png|jpg|jpeg|gif|svg|ico|woff|woff2|ttf|eot|map|json)$", path, re.IGNORECASE):
-                    continue
-
-            normalized = self._normalize_path(path)
-            key = "{}:{}:{}".format(method, host, normalized)
-
-            if key not in seen_hashes:
-                seen_hashes.add(key)
-                self.normal_requests.append((item, {
-                    "id": len(self.normal_requests) + 1,
-                    "method": method,
-                    "host": host,
-                    "normalized": normalized
-                }))
-
-        for _, meta in self.normal_requests:
-            self._normal_table_model.addRow([
-                meta["id"],
-                meta["method"],
-                meta["host"],
-                meta["normalized"]
-            ])
-
-        self._normal_sorter.setSortKeys([TableRowSorter.SortKey(0, SortOrder.ASCENDING)])
+        # Filter toggles pass no event and re-filter the last snapshot; Start rescans.
+        # The snapshot stays Burp's array; live items are kept in a separate tail.
+        if event is not None or self._last_history is None:
+            self._last_history = self._callbacks.getProxyHistory()
+            self._live_items = []
+            self._live_seen = set()
+            # Parsed results are only reusable for items of the same snapshot
+            self._analyze_cache = {}
+
+        self._normal_start_btn.setEnabled(False)
+        self._normal_worker = NormalAnalysisWorker(
+            self,
+            self._last_history,
+            # The tail keeps growing on the EDT, so the worker gets its own copy
+            list(self._live_items),
+            self._normal_filter_post.isSelected(),
+            self._normal_filter_get.isSelected(),
+            self._normal_filter_no_ext.isSelected())
+        self._normal_worker.execute()
+
+    def _append_normal_rows(self, entries):
+        """Append a batch of unique (item, meta) entries to the normal table."""
+        model = self._normal_table_model
+        first = model.getRowCount()
+        data = model.getDataVector()
+        data.ensureCapacity(first + len(entries))
+        for entry in entries:
+            meta = entry[1]
+            self.normal_requests.append(entry)
+            data.add(Vector([meta.id, meta.method, meta.host, meta.normalized]))
+        model.fireTableRowsInserted(first, model.getRowCount() - 1)
+
+    def _on_normal_analysis_done(self, worker):
+        """Re-enable the normal controls once the current worker finishes."""
+        if worker is not self._normal_worker:
+            return
+        self._normal_worker = None
+        self._normal_seen = worker.seen_hashes
+        self._normal_next_id = worker.count + 1
+        self._normal_start_btn.setEnabled(True)
+
+        # Live items that arrived during the scan; duplicates of scanned items are dropped
+        pending = self._normal_pending
+        self._normal_pending = []
+        for item, request in pending:
+            self._append_normal_entry(item, request)
+
+    def _normal_entry(self, request, filter_post, filter_get, filter_no_ext):
+        """Return (method, host, normalized) for a request kept by the filters, else None."""
+        method, host, path = request
+        path_lower = path.lower()
+        method_upper = method.upper()
+
+        if "graphql" in path_lower:
+            return None
+
+        if filter_post and not filter_get:
+            if method_upper != "POST":
+                return None
+        elif filter_get and not filter_post:
+            if method_upper != "GET":
+                return None
+
+        if filter_no_ext:
+            if path_lower.endswith(_BLOCKED_EXTS):
+                return None
+
+        return (method, host, self._normalize_path(path))
+
+    def _incremental_ingest(self, item):
+        """Analyze a newly proxied item and queue it for the normal table."""
+        if self._last_history is None:
+            return
+        # Live items are parsed directly rather than through the snapshot's cache
+        request_info = self._helpers.analyzeRequest(item)
+        url = request_info.getUrl()
+        request = (request_info.getMethod(), url.getHost(), url.getPath())
+        # GraphQL traffic never appears in the normal table
+        if "graphql" in request[2].lower():
+            return
+        SwingUtilities.invokeLater(NormalRowAppender(self, item, request))
+
+    def _ingest_live_item(self, item, request):
+        """Add a live item to the live tail and to the normal table."""
+        # Nothing is tracked after Clear All until the next Start
+        if self._last_history is None:
+            return
+        # Items with the same method, host and path behave identically under
+        # every filter, so only the first one is kept
+        if request in self._live_seen:
+            return
+        self._live_seen.add(request)
+        # Keep the message bytes in Burp's temp files rather than on the heap
+        item = self._callbacks.saveBuffersToTempFiles(item)
+        self._live_items.append((item, request))
+        if self._normal_worker is not None:
+            self._normal_pending.append((item, request))
+            return
+        self._append_normal_entry(item, request)
+
+    def _append_normal_entry(self, item, request):
+        """Append a single item to the normal table unless it is filtered or a duplicate."""
+        key = self._normal_entry(
+            request,
+            self._normal_filter_post.isSelected(),
+            self._normal_filter_get.isSelected(),
+            self._normal_filter_no_ext.isSelected())
+        if key is None or key in self._normal_seen:
+            return
+        self._normal_seen.add(key)
+        method, host, normalized = key
+        self._append_normal_rows([(item, NormalMeta(
+            self._normal_next_id, method, host, normalized))])
+        self._normal_next_id += 1
+
+    def _analyze(self, item):
+        """Return the (method, host, path) of a proxy item, parsing it only once."""
+        k = id(item)
+        cached = self._analyze_cache.get(k)
+        if cached is not None and cached[0] is item:
+            return cached[1]
+        request_info = self._helpers.analyzeRequest(item)
+        url = request_info.getUrl()
+        v = (request_info.getMethod(), url.getHost(), url.getPath())
+        # Keep the item alive alongside its result so its id cannot be reused
+        self._analyze_cache[k] = (item, v)
+        return v
 
     def _normalize_path(self, path):
         """Normalize the request path by replacing dynamic values with placeholders."""
-        path = re.sub(r"/\d+", "/{id}", path)
-        path = re.sub(r"/[a-f0-9]{32,}", "/{hash}", path)
-        path = re.sub(r"id=\d+", "id={id}", path)
-        return path
+        normalized = self._norm_cache.get(path)
+        if normalized is None:
+            normalized = _PAT.sub(
+                lambda m: "/{id}" if m.group(1) else "/{hash}" if m.group(2) else "id={id}",
+                path)
+            if len(self._norm_cache) >= _NORM_CACHE_SIZE:
+                # Start over rather than evict: the analysis worker and the EDT
+                # (live rows) both write here, and iterating the dict to pick a
+                # victim can fail if the other thread inserts meanwhile
+                self._norm_cache = {}
+            self._norm_cache[path] = normalized
+        return normalized
 
     def _show_normal_filter_menu(self, event):
         """Show the filter menu for normal requests."""
@@ -333,47 +453,63 @@ class BurpExtender(IBurpExtender, ITab, IMessageEditorController):
         for idx, item in enumerate(http_items, 1):
             request_info = self._helpers.analyzeRequest(item)
             url_obj = request_info.getUrl()
-            path = url_obj.getPath()
-            url = url_obj.toString()
+            path_lower = url_obj.getPath().lower()
 
-            if "graphql" in path.lower():
-                body_offset = request_info.getBodyOffset()
-                body_bytes = item.getRequest()[body_offset:]
-                body_str = self._helpers.bytesToString(body_bytes)
+            if "graphql" in path_lower:
+                raw = item.getRequest()
+                body_start = request_info.getBodyOffset()
+                body_end = len(raw)
+                if body_end - body_start > _MAX_GRAPHQL_BODY:
+                    continue
+                # Only JSON object bodies can carry a query; skip the rest before decoding
+                while body_start < body_end and raw[body_start] in _JSON_WHITESPACE:
+                    body_start += 1
+                if body_start >= body_end or raw[body_start] != _JSON_OBJECT_START:
+                    continue
+                body_str = self._helpers.bytesToString(raw[body_start:])
 
                 try:
                     json_body = json.loads(body_str)
-                    query = json_body.get("query")
-                    query_hash = json_body.get("queryHash")
-                    op_name = json_body.get("operationName", "Unnamed")
-
-                    if query:
-                        key = hashlib.sha256(query.encode()).hexdigest()
-                    elif query_hash:
-                        key = query_hash
-                    else:
-                        continue
-
-                    if key not in seen_hashes:
-                        seen_hashes.add(key)
-                        self.graphql_requests.append((item, {
-                            "id": len(self.graphql_requests) + 1,
-                            "method": request_info.getMethod(),
-                            "url": url,
-                            "operation": op_name
-                        }))
-                except:
+                except ValueError:
                     continue
 
+                query = json_body.get("query")
+                query_hash = json_body.get("queryHash")
+                op_name = json_body.get("operationName", "Unnamed")
+
+                # Only string identifiers are usable (and hashable) dedupe keys
+                if query and isinstance(query, basestring):
+                    key = query
+                elif query_hash and isinstance(query_hash, basestring):
+                    key = query_hash
+                else:
+                    continue
+
+                if key in seen_hashes:
+                    continue
+                seen_hashes.add(key)
+                # Only unique entries pay for the URL and method conversions
+                self.graphql_requests.append((item, GraphqlMeta(
+                    len(self.graphql_requests) + 1,
+                    request_info.getMethod(), url_obj.toString(), op_name)))
+
+        # Swap the rows in place so the table keeps its column layout
+        self._graphql_table.setRowSorter(None)
+        model = self._graphql_table_model
+        data = model.getDataVector()
+        data.clear()
+        data.ensureCapacity(len(self.graphql_requests))
         for _, meta in self.graphql_requests:
-            self._graphql_table_model.addRow([
-                meta["id"],
-                meta["method"],
-                meta["url"],
-                meta["operation"]
-            ])
+            data.add(Vector([meta.id, meta.method, meta.url, meta.operation]))
+        model.fireTableDataChanged()
+        self._attach_sorter(self._graphql_table, self._graphql_sorter)
 
-        self._graphql_sorter.setSortKeys([TableRowSorter.SortKey(0, SortOrder.ASCENDING)])
+    def _attach_sorter(self, table, sorter):
+        """Reattach a detached sorter and sort the current rows by ID once."""
+        table.setRowSorter(sorter)
+        # The sorter missed the model events while detached; resync it
+        sorter.allRowsChanged()
+        sorter.setSortKeys([TableRowSorter.SortKey(0, SortOrder.ASCENDING)])
 
     def _create_table_model(self, column_names):
         """Create a non-editable table model with the specified columns."""
@@ -394,8 +530,12 @@ class BurpExtender(IBurpExtender, ITab, IMessageEditorController):
 
             row = table.getSelectedRow()
             if row >= 0:
-                model_index = table.getRowSorter().convertRowIndexToModel(row)
+                model_index = table.convertRowIndexToModel(row)
                 item = data[model_index][0]
+                # Selection changes can fire repeatedly for the same row
+                if item is self._last_selected_item:
+                    return
+                self._last_selected_item = item
                 self._current_request = item.getRequest()
                 self._current_response = item.getResponse()
                 self._current_service = item.getHttpService()
@@ -419,7 +559,7 @@ class BurpExtender(IBurpExtender, ITab, IMessageEditorController):
 
         row = table.getSelectedRow()
         if row >= 0:
-            model_index = table.getRowSorter().convertRowIndexToModel(row)
+            model_index = table.convertRowIndexToModel(row)
             item = data[model_index][0]
             service = item.getHttpService()
             req_bytes = item.getRequest()
@@ -445,7 +585,7 @@ class BurpExtender(IBurpExtender, ITab, IMessageEditorController):
 
         row = table.getSelectedRow()
         if row >= 0:
-            model_index = table.getRowSorter().convertRowIndexToModel(row)
+            model_index = table.convertRowIndexToModel(row)
 
             confirm = JOptionPane.showConfirmDialog(
                 None,
@@ -457,6 +597,7 @@ class BurpExtender(IBurpExtender, ITab, IMessageEditorController):
                 del data[model_index]
                 model.removeRow(model_index)
                 if table.getRowCount() == 0:
+                    self._last_selected_item = None
                     self._requestViewer.setMessage(b"", True)
                     self._responseViewer.setMessage(b"", False)
 
@@ -469,8 +610,19 @@ class BurpExtender(IBurpExtender, ITab, IMessageEditorController):
             JOptionPane.YES_NO_OPTION
         )
         if confirm == JOptionPane.YES_OPTION:
+            if self._normal_worker is not None:
+                self._normal_worker.cancel(True)
+                self._normal_worker = None
+                self._normal_start_btn.setEnabled(True)
+            self._normal_seen = None
+            self._normal_pending = []
+            self._live_items = []
+            self._live_seen = set()
             self.normal_requests = []
+            self._analyze_cache = {}
+            self._last_history = None
             self._normal_table_model.setRowCount(0)
+            self._last_selected_item = None
             self._requestViewer.setMessage(b"", False)
             self._responseViewer.setMessage(b"", True)
 
@@ -485,6 +637,7 @@ class BurpExtender(IBurpExtender, ITab, IMessageEditorController):
         if confirm == JOptionPane.YES_OPTION:
             self.graphql_requests = []
             self._graphql_table_model.setRowCount(0)
+            self._last_selected_item = None
             self._requestViewer.setMessage(b"", False)
             self._responseViewer.setMessage(b"", True)
 
@@ -513,6 +666,106 @@ class BurpExtender(IBurpExtender, ITab, IMessageEditorController):
         return self._main_panel
 
 
+class DividerUpdater(Runnable):
+    """Runnable that restores the split pane dividers after a mode switch."""
+    def __init__(self, extender, mode):
+        self.extender = extender
+        self.mode = mode
+
+    def run(self):
+        if self.mode == "normal":
+            self.extender._normal_split_pane.setDividerLocation(0.4)
+        else:
+            self.extender._graphql_split_pane.setDividerLocation(0.4)
+        self.extender._viewer_split.setDividerLocation(0.4)
+
+
+class NormalAnalysisWorker(SwingWorker):
+    """Background worker that dedupes proxy items and streams unique rows to the EDT."""
+    def __init__(self, extender, http_items, live_items, filter_post, filter_get, filter_no_ext):
+        SwingWorker.__init__(self)
+        self.extender = extender
+        self.http_items = http_items
+        self.live_items = live_items
+        self.filter_post = filter_post
+        self.filter_get = filter_get
+        self.filter_no_ext = filter_no_ext
+        self.seen_hashes = set()
+        self.count = 0
+
+    def doInBackground(self):
+        extender = self.extender
+        filter_post = self.filter_post
+        filter_get = self.filter_get
+        filter_no_ext = self.filter_no_ext
+        seen_hashes = self.seen_hashes
+        chunk = []
+
+        for item, request in self._requests():
+            if self.isCancelled():
+                return None
+            key = extender._normal_entry(request, filter_post, filter_get, filter_no_ext)
+
+            if key is not None and key not in seen_hashes:
+                seen_hashes.add(key)
+                self.count += 1
+                method, host, normalized = key
+                chunk.append((item, NormalMeta(self.count, method, host, normalized)))
+                # publish() is varargs, so Jython sends each entry of the list
+                # as its own value; process() receives the entries, not batches
+                if len(chunk) >= _NORMAL_PUBLISH_BATCH:
+                    self.publish(chunk)
+                    chunk = []
+
+        if chunk:
+            self.publish(chunk)
+        return None
+
+    def _requests(self):
+        """Yield (item, (method, host, path)) for the snapshot, then the live tail."""
+        for item in self.http_items:
+            yield item, self.extender._analyze(item)
+        for entry in self.live_items:
+            yield entry
+
+    def process(self, entries):
+        if self.isCancelled():
+            return
+        self.extender._append_normal_rows(list(entries))
+
+    def done(self):
+        try:
+            self.get()
+        except CancellationException:
+            pass
+        except ExecutionException as e:
+            self.extender._callbacks.printError(
+                "Normal analysis failed: {}".format(e.getCause()))
+        self.extender._on_normal_analysis_done(self)
+
+
+class ProxyFeed(IHttpListener):
+    """HTTP listener that feeds completed Proxy messages into the normal table."""
+    def __init__(self, extender):
+        self.extender = extender
+
+    def processHttpMessage(self, toolFlag, messageIsRequest, messageInfo):
+        if messageIsRequest or toolFlag != self.extender._callbacks.TOOL_PROXY:
+            return
+        self.extender._incremental_ingest(messageInfo)
+
+
+class NormalRowAppender(Runnable):
+    """Runnable that hands one live Proxy item to the normal table on the EDT."""
+    def __init__(self, extender, item, request):
+        self.extender = extender
+        self.item = item
+        self.request = request
+
+    def run(self):
+        self.extender._ingest_live_item(self.item, self.request)
+
+
 class TableMouseAdapter(MouseAdapter):
     """Mouse adapter for handling table row selection and context menu."""
     def __init__(self, table, popup_menu):
@@ -543,15 +796,44 @@ class TableMouseAdapter(MouseAdapter):
                 self.popup_menu.show(self.table, evt.getX(), evt.getY())
 
 
-class SearchListener(DocumentListener):
-    """Document listener for handling search field updates."""
+class ModeSelectionListener(ListSelectionListener):
+    """Selection listener that forwards row selection events for a fixed mode."""
+    def __init__(self, extender, mode):
+        self.extender = extender
+        self.mode = mode
+
+    def valueChanged(self, e):
+        self.extender._on_row_select(e, self.mode)
+
+
+class ModeActionListener(ActionListener):
+    """Action listener that invokes a mode-aware handler for a fixed mode."""
+    def __init__(self, handler, mode):
+        self.handler = handler
+        self.mode = mode
+
+    def actionPerformed(self, e):
+        self.handler(e, self.mode)
+
+
+class SearchListener(DocumentListener, ActionListener):
+    """Document listener for handling search field updates.
+
+    Edits restart a single-shot timer so the row filter is only rebuilt
+    once the user stops typing.
+    """
     def __init__(self, extender, mode):
         self.extender = extender
         self.mode = mode
+        self._timer = Timer(_SEARCH_DELAY_MS, self)
+        self._timer.setRepeats(False)
+        self._last_filter = (None, None)
+
+    def insertUpdate(self, e): self._timer.restart()
+    def removeUpdate(self, e): self._timer.restart()
+    def changedUpdate(self, e): self._timer.restart()
 
-    def insertUpdate(self, e): self._filter()
-    def removeUpdate(self, e): self._filter()
-    def changedUpdate(self, e): self._filter()
+    def actionPerformed(self, e): self._filter()
 
     def _filter(self):
         """Apply the search filter to the table."""
@@ -568,6 +850,10 @@ class SearchListener(DocumentListener):
             sorter.setRowFilter(None)
         else:
             try:
-                sorter.setRowFilter(RowFilter.regexFilter("(?i)" + text, col_idx))
+                last_text, row_filter = self._last_filter
+                if text != last_text:
+                    row_filter = RowFilter.regexFilter("(?i)" + text, col_idx)
+                    self._last_filter = (text, row_filter)
+                sorter.setRowFilter(row_filter)
             except:
                 sorter.setRowFilter(None)